@@ -2,14 +2,19 @@ import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 import os
-import threading
-from flask import Flask
+import asyncio
+import itertools
+from aiohttp import web
+
+# Load environment variables before importing modules that read them.
+# Deployments inject these directly, so only parse .env when they're missing.
+if not (os.getenv('DISCORD_TOKEN') and os.getenv('DATABASE_URL')):
+    load_dotenv()
+
 from database import DatabaseManager
 from utils import log_event
-from cogs.secret_santa import SecretSantaCog, CustomHelpCommand
+from cogs.secret_santa import SecretSantaCog, CustomHelpCommand, RateLimited
 
-# Load environment variables
-load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 
 # Set up intents
@@ -17,20 +22,69 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
+def get_prefix(bot, message):
+    """Match s!/S! with a single slice compare, only building mention prefixes otherwise"""
+    prefix = message.content[:2]
+    if prefix in ('s!', 'S!'):
+        return prefix
+    return commands.when_mentioned(bot, message)
+
+class SecretSantaBot(commands.Bot):
+    """Bot that also stops the health check server when it shuts down"""
+    # AppRunner serving /health, set by setup_hook once the port is bound
+    health_runner = None
+
+    async def close(self):
+        try:
+            await super().close()
+        finally:
+            if self.health_runner:
+                await self.health_runner.cleanup()
+                self.health_runner = None
+
 # Initialize bot
-bot = commands.Bot(
-    command_prefix=commands.when_mentioned_or('s!', 'S!'), 
+bot = SecretSantaBot(
+    command_prefix=get_prefix, 
     case_insensitive=True,
     intents=intents
 )
 
-# Initialize database (may be None if not configured yet)
+# Longest error text written to the log, so s!logs replies stay within Discord's limit
+LOG_ERROR_LENGTH = 300
+
+# Seconds to wait between database connection attempts
+DB_RETRY_DELAYS = (0.5, 1, 2, 4, 8, 16, 30)
+
+# Database is connected in the background (None until it's ready)
 db_manager = None
-try:
-    db_manager = DatabaseManager()
-except Exception as e:
-    print(f"⚠️  Database not available yet: {e}")
-    print("🔧 Bot will start without database - add database and redeploy")
+bot.db_manager = None
+
+async def connect_database():
+    """Connect to the database with exponential backoff, then load the Secret Santa commands"""
+    global db_manager
+    # Keep retrying every DB_RETRY_DELAYS[-1] seconds once the backoff is used up
+    for delay in itertools.chain(DB_RETRY_DELAYS, itertools.repeat(DB_RETRY_DELAYS[-1])):
+        try:
+            db_manager = await asyncio.to_thread(DatabaseManager)
+            break
+        except ValueError as e:
+            # DATABASE_URL isn't configured, retrying won't help
+            print(f"⚠️  Database not configured: {e}")
+            log_event("ERROR", f"Database not configured: {e}")
+            break
+        except Exception as e:
+            print(f"⚠️  Database not available yet: {e} (retrying in {delay}s)")
+            log_event("ERROR", " ".join(f"Database not available yet: {e}".split())[:LOG_ERROR_LENGTH])
+            await asyncio.sleep(delay)
+
+    if not db_manager:
+        print("🔧 Secret Santa commands disabled - set DATABASE_URL and redeploy")
+        return
+
+    # Share the single database manager with extensions
+    bot.db_manager = db_manager
+    await bot.wait_until_ready()
+    await bot.add_cog(SecretSantaCog(bot, db_manager))
 
 # Set up help command
 bot.help_command = CustomHelpCommand()
@@ -38,45 +92,57 @@ bot.help_command = CustomHelpCommand()
 @bot.event
 async def on_ready():
     print(f'{bot.user} has connected to Discord!')
-    # Add cogs here after bot is ready
-    if db_manager:
-        await bot.add_cog(SecretSantaCog(bot, db_manager))
-    else:
-        print("⚠️  Secret Santa commands disabled - no database connection")
+    # The cog is added by connect_database once the database is ready
+    if not db_manager:
+        print("⚠️  Secret Santa commands unavailable until the database connects")
     await bot.change_presence(activity=discord.Game(name="Secret Santa"))
 
-def check_permissions(ctx):
-    if isinstance(ctx.author, discord.Member):
-        permissions = ctx.channel.permissions_for(ctx.author)
-        can_send_messages = permissions.send_messages
-        can_read_messages = permissions.read_messages
-        return can_send_messages and can_read_messages
-    return True
-
 @bot.event
 async def on_command_error(ctx, error):
     if isinstance(error, commands.CommandNotFound):
         await ctx.send("Command not found. Use `s!help` to see available commands.")
+    elif isinstance(error, commands.CommandOnCooldown):
+        await ctx.send(f"⏳ This command is on cooldown. Try again in {error.retry_after:.1f} seconds.")
+    elif isinstance(error, RateLimited):
+        # The cog has already told the user to slow down
+        return
+    elif isinstance(error, commands.CheckFailure):
+        await ctx.send(str(error))
     else:
+        # Only exceptions raised inside a command are bugs worth logging; argument
+        # errors and the like are the user's to fix
+        if isinstance(error, commands.CommandInvokeError):
+            original = error.original
+            detail = " ".join(f"{type(original).__name__}: {original}".split())
+            log_event("ERROR", f"{ctx.command}: {detail}"[:LOG_ERROR_LENGTH])
         error_msg = str(error)[:900]
-        print(f"Error: {error}")
         await ctx.send(f"❌ An error occurred: {error_msg}")
 
-# Health check Flask app
-app = Flask(__name__)
-
-@app.route('/health')
-def health_check():
+# Health check endpoint, served on the bot's own event loop
+async def health_check(request):
     """Health check endpoint for DigitalOcean"""
-    return {'status': 'healthy', 'bot_ready': bot.is_ready()}, 200
+    return web.json_response({'status': 'healthy', 'bot_ready': bot.is_ready()})
 
-def run_health_server():
-    """Run Flask health check server in a separate thread"""
-    app.run(host='0.0.0.0', port=8080, debug=False, use_reloader=False)
+@bot.event
+async def setup_hook():
+    """Start the health check server and database connection before connecting to Discord"""
+    app = web.Application()
+    app.router.add_get('/health', health_check)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, '0.0.0.0', 8080).start()
+    except OSError as e:
+        # The health check is optional; a busy port shouldn't stop the bot
+        print(f"⚠️  Health check server not started: {e}")
+        log_event("ERROR", f"Health check server not started: {e}")
+        await runner.cleanup()
+    else:
+        # Released in close() so port 8080 is freed on shutdown
+        bot.health_runner = runner
 
-# Start health check server in background thread
-health_thread = threading.Thread(target=run_health_server, daemon=True)
-health_thread.start()
+    # Keep a reference so the background task isn't garbage collected
+    bot.db_task = asyncio.create_task(connect_database())
 
 # Run bot
 if __name__ == "__main__":
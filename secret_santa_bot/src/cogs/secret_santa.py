@@ -1,74 +1,284 @@
 import discord
 from discord.ext import commands
-from utils import log_event
+from utils import LOG_FILE, log_event
+from database import AsyncDatabaseManager, assign_partners
 import asyncio
 import time
-from collections import defaultdict
+from collections import OrderedDict, deque
 
 # Rate limiting configuration
 RATE_LIMIT_COMMANDS = 5  # Max commands per window
 RATE_LIMIT_WINDOW = 30   # Window in seconds
 
+# Per-user cooldowns, rejected by discord.py before any DB or API work
+READ_COOLDOWN = 3.0      # Seconds between read-only commands
+MESSAGE_COOLDOWN = 5.0   # Seconds between anonymous messages
+REMIND_COOLDOWN = 30.0   # Seconds between reminder rounds per server
+
+# How long a rendered s!info reply is reused
+INFO_CACHE_TTL = 5  # Seconds
+
+# Users fetched from the API (not in the gateway cache) kept for reuse
+USER_CACHE_SIZE = 512
+
+# Max DMs in flight at once when messaging many participants
+DM_CONCURRENCY = 5
+
+# Bulk DM pacing, kept well under Discord's global request limit
+DM_RATE_LIMIT = 10      # DMs per window
+DM_RATE_WINDOW = 1.0    # Window in seconds
+
+def split_message(text: str, size: int = 1900) -> list[str]:
+    """Split text into chunks that fit in a Discord message, in a single pass"""
+    if len(text) <= size:
+        return [text]
+    return [text[i:i+size] for i in range(0, len(text), size)]
+
+# Static help listing, built once at import time
+HELP_TEXT = (
+    "Available commands:\n"
+    "s!create - Create a new Secret Santa event\n"
+    "s!join - Join the Secret Santa event\n"
+    "s!setwishlist - Set your gift preferences\n"
+    "s!setaddress - Set your delivery address\n"
+    "s!myinfo - View your current wishlist and address\n"
+    "s!match - Get your Secret Santa match information again\n"
+    "s!participants - List all participants\n"
+    "s!message - Send a message to your Secret Santa partner\n"
+    "s!start - Start the Secret Santa event\n"
+    "s!cancel - Cancel the Secret Santa event\n"
+    "s!remind - Send reminders to participants with missing info\n"
+    "s!info - Display bot information\n"
+    "s!broadcast - Send a message to all participants (admin only)\n"
+    "s!remove - Remove a participant from the event (admin only)\n"
+    "s!ratelimit - Set rate limiting for commands (admin only)\n"
+    "s!logs - View recent log entries (admin only)\n"
+)
+HELP_CHUNKS = tuple(split_message(HELP_TEXT))
+
+# Fixed command replies, built once at import time
+CREATE_MSG = (
+    "🎄 {name} has started a Secret Santa event! 🎅\n\n"
+    "To join the Secret Santa:\n"
+    "1. Use `s!join` in this channel or DM the bot\n"
+    "2. You'll receive instructions to set your wishlist and address\n\n"
+    "Once everyone has joined and set their preferences, use `s!start` to begin!"
+)
+
+WELCOME_MSG = (
+    "Welcome to Secret Santa! 🎅\n\n"
+    "Please set up your preferences:\n"
+    "1. Set your wishlist with `s!setwishlist <your wishlist>`\n"
+    "2. Set your address with `s!setaddress <your address>`\n\n"
+    "Both are required before the event can start!"
+)
+
+# Match details, filled per recipient with format_map
+MATCH_INTRO_MSG = (
+    "🎄 Your Secret Santa match:\n\n"
+    "**Recipient:** {name}\n"
+)
+
+MATCH_INSTRUCTIONS = "You can message them anonymously using `s!message giftee <your message>`"
+
+MATCH_MSG = (
+    MATCH_INTRO_MSG +
+    "**Wishlist:** {wishlist}\n"
+    "**Delivery Address:** {address}\n\n" +
+    MATCH_INSTRUCTIONS
+)
+
+# Start-blocked reminders, keyed by (missing_wishlist, missing_address)
+MISSING_INFO_TEMPLATE = (
+    "⚠️ The Secret Santa event cannot start because you haven't set your:\n"
+    "{items}\n"
+    "Please set these to allow the event to start!"
+)
+
+MISSING_INFO_MSGS = {
+    (True, False): MISSING_INFO_TEMPLATE.format(items="wishlist (use s!setwishlist)"),
+    (False, True): MISSING_INFO_TEMPLATE.format(items="address (use s!setaddress)"),
+    (True, True): MISSING_INFO_TEMPLATE.format(items="wishlist (use s!setwishlist), address (use s!setaddress)"),
+}
+
+RATELIMIT_USAGE = (
+    "❌ Invalid action! Use:\n"
+    "`s!ratelimit on` - Enable rate limiting\n"
+    "`s!ratelimit off` - Disable rate limiting\n"
+    "`s!ratelimit commands <number>` - Set max commands\n"
+    "`s!ratelimit window <seconds>` - Set time window\n"
+    "`s!ratelimit status` - Show current settings"
+)
+
+# s!message recipient types: how to find the partner and what to reply
+RECIPIENT_ROUTES = {
+    # The user's gifter (person giving them a gift)
+    'gifter': {
+        'lookup': 'get_gifter_for_user',
+        'notification': (
+            "🎄 Your giftee sent you a message:\n\n"
+            "{message}\n\n"
+            "To reply, use: `s!message giftee <your message>`"
+        ),
+        'sender': "Giftee({name})",
+        'log_type': "TO_GIFTER",
+        'unassigned': "❌ You don't have a Secret Santa assigned yet!",
+        'sent': "✉️ Message sent to your Secret Santa!",
+        'dms_disabled': "❌ Couldn't send message - your Secret Santa has DMs disabled",
+    },
+    # The user's giftee (person they're giving a gift to)
+    'giftee': {
+        'lookup': 'get_giftee_for_user',
+        'notification': (
+            "🎁 Your Secret Santa sent you a message:\n\n"
+            "{message}\n\n"
+            "To reply, use: `s!message gifter <your message>`"
+        ),
+        'sender': "Gifter({name})",
+        'log_type': "TO_GIFTEE",
+        'unassigned': "❌ You don't have a gift recipient assigned yet!",
+        'sent': "✉️ Message sent to your giftee!",
+        'dms_disabled': "❌ Couldn't send message - your giftee has DMs disabled",
+    },
+}
+
+class RateLimited(commands.CommandError):
+    """Raised before a command runs when its author is over the rate limit; they've already been told"""
+
+def requires_active_event(inactive_msg: str = "❌ There is no active Secret Santa event! Ask an admin to create one with `s!create`"):
+    """Reject the command up front, from the cached flag, when no event is running"""
+    async def predicate(ctx):
+        if not await ctx.cog._is_event_active():
+            raise commands.CheckFailure(inactive_msg)
+        return True
+    return commands.check(predicate)
+
+def requires_event_manager(denied_msg: str):
+    """Only let server admins or the event creator run the command"""
+    async def predicate(ctx):
+        if not await ctx.cog._can_manage_event(ctx):
+            raise commands.CheckFailure(denied_msg)
+        return True
+    return commands.check(predicate)
+
 class CustomHelpCommand(commands.DefaultHelpCommand):
     async def send_bot_help(self, mapping):
-        help_text = "Available commands:\n"
-        help_text += "s!create - Create a new Secret Santa event\n"
-        help_text += "s!join - Join the Secret Santa event\n"
-        help_text += "s!setwishlist - Set your gift preferences\n"
-        help_text += "s!setaddress - Set your delivery address\n"
-        help_text += "s!myinfo - View your current wishlist and address\n"
-        help_text += "s!match - Get your Secret Santa match information again\n"
-        help_text += "s!participants - List all participants\n"
-        help_text += "s!message - Send a message to your Secret Santa partner\n"
-        help_text += "s!start - Start the Secret Santa event\n"
-        help_text += "s!cancel - Cancel the Secret Santa event\n"
-        help_text += "s!remind - Send reminders to participants with missing info\n"
-        help_text += "s!info - Display bot information\n"
-        help_text += "s!broadcast - Send a message to all participants (admin only)\n"
-        help_text += "s!remove - Remove a participant from the event (admin only)\n"
-        help_text += "s!ratelimit - Set rate limiting for commands (admin only)\n"
-        help_text += "s!logs - View recent log entries (admin only)\n"
-        
-        # Split into multiple messages if too long
-        if len(help_text) > 1900:
-            messages = [help_text[i:i+1900] for i in range(0, len(help_text), 1900)]
-            for msg in messages:
-                await self.get_destination().send(msg)
-        else:
-            await self.get_destination().send(help_text)
+        # Sent in order, so the chunks read as one listing
+        destination = self.get_destination()
+        for chunk in HELP_CHUNKS:
+            await destination.send(chunk)
 
 class SecretSantaCog(commands.Cog):
     def __init__(self, bot, db_manager):
         self.bot = bot
-        self.db_manager = db_manager
-        # Rate limiting: {user_id: [timestamp1, timestamp2, ...]}
-        self.user_command_history = defaultdict(list)
+        # All DB access goes through worker threads so commands never block the event loop
+        self.db_manager = AsyncDatabaseManager(db_manager)
+        # Rate limiting: {user_id: deque([timestamp1, timestamp2, ...])}, oldest first and
+        # capped at rate_limit_commands, since older entries can never matter
+        self.user_command_history = {}
+        # When histories were last swept for users who have gone quiet
+        self._last_history_sweep = 0.0
         self.rate_limit_enabled = True
         self.rate_limit_commands = RATE_LIMIT_COMMANDS
         self.rate_limit_window = RATE_LIMIT_WINDOW
+        # psutil is only needed by s!info, so the process handle is created on first use
+        self._process = None
+        # (timestamp, rendered text) of the last s!info reply
+        self._info_cache = (0.0, "")
+        # LRU of users fetched on gateway cache misses: {user_id: User}
+        self._fetched_users = OrderedDict()
+        # Whether an event is running; this cog is the only writer, so the DB is
+        # only consulted when the flag is unknown (None)
+        self._event_active = None
+        # Creator of the running event, same ownership as _event_active:
+        # None when unknown, 0 when there's no event (snowflakes are never 0)
+        self._creator_id = None
+        # Start times of the last DM_RATE_LIMIT bulk DMs, shared by all fan-outs
+        self._dm_times = deque(maxlen=DM_RATE_LIMIT)
+        self._dm_lock = asyncio.Lock()
+
+    def _get_info_message(self) -> str:
+        """Render the s!info reply, rebuilding it at most every INFO_CACHE_TTL seconds"""
+        now = time.monotonic()
+        timestamp, info_msg = self._info_cache
+        if now - timestamp > INFO_CACHE_TTL:
+            if self._process is None:
+                import psutil
+                self._process = psutil.Process()
+            memory_usage = round(self._process.memory_info().rss / 1048576, 2)
+            info_msg = (
+                "🤖 **Secret Santa Bot Info:**\n\n"
+                f"**Servers:** {len(self.bot.guilds)}\n"
+                f"**Latency:** {round(self.bot.latency * 1000)}ms\n"
+                f"**Memory Usage:** {memory_usage} MB"
+            )
+            self._info_cache = (now, info_msg)
+        return info_msg
 
-    def _check_rate_limit(self, user_id: str) -> tuple[bool, int]:
+    def _check_rate_limit(self, user_id: int) -> tuple[bool, int]:
         """Check if user is rate limited. Returns (is_limited, seconds_remaining)"""
         if not self.rate_limit_enabled:
             return False, 0
         
         current_time = time.time()
+        window_start = current_time - self.rate_limit_window
+
+        # At most once per window, drop users whose every entry has expired
+        if current_time - self._last_history_sweep >= self.rate_limit_window:
+            self._last_history_sweep = current_time
+            stale = [uid for uid, history in self.user_command_history.items()
+                     if not history or history[-1] <= window_start]
+            for uid in stale:
+                del self.user_command_history[uid]
+
+        history = self.user_command_history.get(user_id)
+        if history is None:
+            history = self.user_command_history[user_id] = deque(maxlen=self.rate_limit_commands)
         # Clean old entries
-        self.user_command_history[user_id] = [
-            t for t in self.user_command_history[user_id] 
-            if current_time - t < self.rate_limit_window
-        ]
+        while history and history[0] <= window_start:
+            history.popleft()
         
         # Check if over limit
-        if len(self.user_command_history[user_id]) >= self.rate_limit_commands:
-            oldest = min(self.user_command_history[user_id])
-            seconds_remaining = int(self.rate_limit_window - (current_time - oldest))
+        if len(history) >= self.rate_limit_commands:
+            seconds_remaining = int(history[0] - window_start)
             return True, max(1, seconds_remaining)
         
         # Record this command
-        self.user_command_history[user_id].append(current_time)
+        history.append(current_time)
         return False, 0
 
+    async def _wait_for_dm_slot(self):
+        """Sliding-window limiter for bulk DMs, so fan-outs never run into 429 backoffs"""
+        async with self._dm_lock:
+            if len(self._dm_times) == DM_RATE_LIMIT:
+                wait = self._dm_times[0] + DM_RATE_WINDOW - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._dm_times.append(time.monotonic())
+
+    async def cog_load(self):
+        """Re-read persisted event state whenever the cog is (re)loaded"""
+        self._event_active = None
+        self._creator_id = None
+
+    async def _is_event_active(self) -> bool:
+        """Check if there's an active event, hitting the DB only on a cache miss"""
+        if self._event_active is None:
+            self._event_active = await self.db_manager.is_event_active()
+        return self._event_active
+
+    async def _get_creator_id(self) -> int:
+        """Get the event creator's ID (0 if none), hitting the DB only on a cache miss"""
+        if self._creator_id is None:
+            self._creator_id = await self.db_manager.get_creator_id() or 0
+        return self._creator_id
+
+    async def _can_manage_event(self, ctx) -> bool:
+        """Server admins pass without a lookup; anyone else must be the event creator"""
+        if isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator:
+            return True
+        return ctx.author.id == await self._get_creator_id()
+
     async def cog_before_invoke(self, ctx):
         """Called before every command - check rate limit"""
         # Skip rate limit for admins/creators
@@ -76,294 +286,241 @@ class SecretSantaCog(commands.Cog):
         if is_admin:
             return
         
-        is_limited, seconds = self._check_rate_limit(str(ctx.author.id))
+        is_limited, seconds = self._check_rate_limit(ctx.author.id)
         if is_limited:
             await ctx.send(f"⏳ Slow down! You're sending commands too fast. Try again in {seconds} seconds.")
-            raise commands.CommandError("Rate limited")
+            raise RateLimited()
 
     async def _show_potential_matches(self, ctx, pairings) -> bool:
         """Show potential matches to creator and get confirmation"""
-        match_msg = "🎄 **Potential Secret Santa Matches:**\n\n"
+        # Paginate on line boundaries so large events don't exceed the message limit
+        paginator = commands.Paginator(prefix="🎄 **Potential Secret Santa Matches:**\n", suffix=None, max_size=1900)
         for pairing in pairings:
-            giver = self.bot.get_user(int(pairing['giver']))
-            receiver = self.bot.get_user(int(pairing['receiver']))
-            if giver and receiver:
-                match_msg += f"• {giver.name} → {receiver.name}\n"
-        
-        match_msg += "\nAre you happy with these matches? (yes/no)"
+            paginator.add_line(f"• {pairing['giver_name']} → {pairing['receiver_name']}")
+        paginator.add_line()
+        paginator.add_line("Are you happy with these matches? (yes/no)")
         
         try:
-            await ctx.author.send(match_msg)
+            # Open the DM up front so the reply check never sees a missing channel
+            dm_channel = ctx.author.dm_channel or await ctx.author.create_dm()
+            for page in paginator.pages:
+                await dm_channel.send(page)
             if isinstance(ctx.channel, discord.TextChannel):
                 await ctx.send("📬 I've sent you the potential matches in a DM!")
         except discord.Forbidden:
             await ctx.send("❌ I couldn't send you a DM! Please check your privacy settings.")
             return False
 
+        author_id, channel_id = ctx.author.id, dm_channel.id
+
         def check(m):
-            return m.author == ctx.author and m.channel == ctx.author.dm_channel and m.content.lower() in ['yes', 'no']
+            return m.author.id == author_id and m.channel.id == channel_id and m.content.lower() in ('yes', 'no')
 
         try:
             response = await self.bot.wait_for('message', timeout=300.0, check=check)
             return response.content.lower() == 'yes'
         except asyncio.TimeoutError:
-            await ctx.author.send("❌ No response received within 5 minutes. Please run s!start again.")
+            await dm_channel.send("❌ No response received within 5 minutes. Please run s!start again.")
             return False
 
     @commands.command(name='create')
     async def create_secret_santa(self, ctx):
         """Create a new Secret Santa event"""
-        if self.db_manager.is_event_active():
+        if await self._is_event_active():
             await ctx.send("❌ A Secret Santa event is already in progress! Cancel it first with `s!cancel`")
             return
         
         # Add creator as first participant
-        self.db_manager.add_participant(str(ctx.author.id), ctx.author.name, is_creator=True)
+        await self.db_manager.add_participant(ctx.author.id, ctx.author.name, is_creator=True)
+        self._event_active = True
+        self._creator_id = ctx.author.id
         log_event("CREATE", f"New Secret Santa event created by {ctx.author.name} in server {ctx.guild.id}")
         
-        create_msg = (
-            f"🎄 {ctx.author.name} has started a Secret Santa event! 🎅\n\n"
-            "To join the Secret Santa:\n"
-            "1. Use `s!join` in this channel or DM the bot\n"
-            "2. You'll receive instructions to set your wishlist and address\n\n"
-            "Once everyone has joined and set their preferences, use `s!start` to begin!"
-        )
-        await ctx.send(create_msg)
+        await ctx.send(CREATE_MSG.format(name=ctx.author.name))
 
     @commands.command(name='join')
+    @requires_active_event()
     async def join_secret_santa(self, ctx):
         """Join the Secret Santa event"""
-        # Check if there's an active event
-        if not self.db_manager.is_event_active():
-            await ctx.send("❌ There is no active Secret Santa event! Ask an admin to create one with `s!create`")
-            return
-            
-        user_id = str(ctx.author.id)
+        user_id = ctx.author.id
         name = ctx.author.name
-        self.db_manager.add_participant(user_id, name)
+        await self.db_manager.add_participant(user_id, name)
         log_event("JOIN", f"{name} joined the Secret Santa event")
         await ctx.send(f"{name}, you've joined the Secret Santa!")
         
         # Send DM with instructions
-        welcome_msg = (
-            "Welcome to Secret Santa! 🎅\n\n"
-            "Please set up your preferences:\n"
-            "1. Set your wishlist with `s!setwishlist <your wishlist>`\n"
-            "2. Set your address with `s!setaddress <your address>`\n\n"
-            "Both are required before the event can start!"
-        )
-        await ctx.author.send(welcome_msg)
+        await ctx.author.send(WELCOME_MSG)
 
     @commands.command(name='start')
+    @requires_active_event()
+    @requires_event_manager("❌ Only the event creator or server administrators can start the Secret Santa!")
     async def start_secret_santa(self, ctx):
         """Start the Secret Santa event and assign partners"""
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can start the Secret Santa!")
-            return
-            
-        participants = self.db_manager.get_all_participants()
+        # Participants and missing information come from one consistent snapshot
+        participants, missing_info = await self.db_manager.get_start_snapshot()
         if len(participants) < 2:
             await ctx.send("At least two participants are required.")
             return
         
         # Check for missing information
-        missing_info = self.db_manager.check_missing_info()
         if missing_info:
             await ctx.send("Cannot start - some users haven't set their preferences!")
             
             # DM users with missing information
-            for user in missing_info:
-                member = self.bot.get_user(int(user['user_id']))
-                if member:
-                    missing_items = []
-                    if user['missing_wishlist']:
-                        missing_items.append("wishlist (use s!setwishlist)")
-                    if user['missing_address']:
-                        missing_items.append("address (use s!setaddress)")
-                    
-                    missing_msg = (
-                        "⚠️ The Secret Santa event cannot start because you haven't set your:\n"
-                        f"{', '.join(missing_items)}\n"
-                        "Please set these to allow the event to start!"
-                    )
-                    await member.send(missing_msg)
+            await self._send_missing_info_reminders(missing_info)
             return
 
-        # Keep generating matches until creator approves
+        # Keep generating matches until creator approves; rejected draws never touch the DB
         matches_approved = False
         while not matches_approved:
-            pairings = self.db_manager.assign_partners(participants)
+            pairings = assign_partners(participants)
             matches_approved = await self._show_potential_matches(ctx, pairings)
             if not matches_approved:
                 await ctx.author.send("🔄 Generating new matches...")
+        await self.db_manager.save_pairings(pairings)
 
-        # Send out match notifications
-        for pairing in pairings:
-            giver = self.bot.get_user(int(pairing['giver']))
-            receiver = self.bot.get_user(int(pairing['receiver']))
-            
-            if giver and receiver:
-                try:
+        sem = asyncio.Semaphore(DM_CONCURRENCY)
+
+        async def notify(pairing):
+            # Names come from the pairing, so givers are DMed by ID without resolving Users
+            try:
+                async with sem:
+                    await self._wait_for_dm_slot()
                     await self._send_match_notification(
-                        giver, 
-                        receiver, 
+                        await self._get_dm_channel(pairing['giver']), 
+                        pairing['receiver_name'], 
                         pairing['receiver_wishlist'],
                         pairing['receiver_address']
                     )
-                except discord.Forbidden:
-                    await ctx.send(f"❌ Couldn't send match notification to {giver.name}. Please check DM permissions.")
+            except discord.Forbidden:
+                await ctx.send(f"❌ Couldn't send match notification to {pairing['giver_name']}. Please check DM permissions.")
+
+        # Send out match notifications to all givers, a few at a time
+        results = await asyncio.gather(*(notify(p) for p in pairings), return_exceptions=True)
+        for pairing, result in zip(pairings, results):
+            if isinstance(result, Exception):
+                log_event("START", f"Match notification to {pairing['giver']} failed: {result}")
         
         log_event("START", f"Secret Santa started by {ctx.author.name} in server {ctx.guild.id}")
         await ctx.send("🎅 Secret Santa has begun! All participants have received their matches via DM!")
 
     @commands.command(name='cancel')
+    # Checks run top to bottom: report a missing event before checking who's asking
+    @requires_active_event("❌ There is no active Secret Santa event to cancel!")
+    @requires_event_manager("❌ Only the event creator or server administrators can cancel the Secret Santa!")
     async def cancel_secret_santa(self, ctx):
         """Cancel the Secret Santa event"""
-        if not self.db_manager.is_event_active():
-            await ctx.send("❌ There is no active Secret Santa event to cancel!")
-            return
-        
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can cancel the Secret Santa!")
-            return
-        
-        self.db_manager.cancel_secret_santa()
+        await self.db_manager.cancel_secret_santa()
+        self._event_active = False
+        self._creator_id = 0
         log_event("CANCEL", f"Secret Santa cancelled by {ctx.author.name} in server {ctx.guild.id}")
         await ctx.send("🎄 Secret Santa event cancelled! Use `s!create` to start a new one.")
 
     @commands.command(name='message')
+    @requires_active_event()
+    @commands.cooldown(1, MESSAGE_COOLDOWN, commands.BucketType.user)
     async def send_anonymous_message(self, ctx, recipient_type: str, *, message: str):
         """Send an anonymous message to your Secret Santa partner"""
-        if not self.db_manager.is_event_active():
-            await ctx.send("❌ There is no active Secret Santa event!")
+        route = RECIPIENT_ROUTES.get(recipient_type.lower())
+        if route is None:
+            await ctx.send("❌ Invalid recipient! Use `gifter` to message your Secret Santa or `giftee` to message your recipient.")
             return
             
         if len(message) > 1000:
             await ctx.send("❌ Message too long! Please keep it under 1000 characters.")
             return
             
-        user_id = str(ctx.author.id)
+        user_id = ctx.author.id
         
-        if recipient_type.lower() == 'gifter':
-            # Get the user's gifter (person giving them a gift)
-            gifter_id = self.db_manager.get_gifter_for_user(user_id)
-            if not gifter_id:
-                await ctx.send("❌ You don't have a Secret Santa assigned yet!")
-                return
-                
-            gifter = self.bot.get_user(int(gifter_id))
-            if gifter:
-                formatted_msg = await self._format_message_notification(message, False)
-                success = await self._send_dm_with_log(
-                    gifter, 
-                    formatted_msg,
-                    f"Giftee({ctx.author.name})", 
-                    "TO_GIFTER"
-                )
-                if success:
-                    await ctx.send("✉️ Message sent to your Secret Santa!")
-                else:
-                    await ctx.send("❌ Couldn't send message - your Secret Santa has DMs disabled")
+        # Look up the partner and replies for this recipient type
+        partner_id = await getattr(self.db_manager, route['lookup'])(user_id)
+        if not partner_id:
+            await ctx.send(route['unassigned'])
+            return
             
-        elif recipient_type.lower() == 'giftee':
-            # Get the user's giftee (person they're giving a gift to)
-            giftee_id = self.db_manager.get_giftee_for_user(user_id)
-            if not giftee_id:
-                await ctx.send("❌ You don't have a gift recipient assigned yet!")
-                return
-                
-            giftee = self.bot.get_user(int(giftee_id))
-            if giftee:
-                formatted_msg = await self._format_message_notification(message, True)
-                success = await self._send_dm_with_log(
-                    giftee, 
-                    formatted_msg,
-                    f"Gifter({ctx.author.name})", 
-                    "TO_GIFTEE"
-                )
-                if success:
-                    await ctx.send("✉️ Message sent to your giftee!")
-                else:
-                    await ctx.send("❌ Couldn't send message - your giftee has DMs disabled")
-        else:
-            await ctx.send("❌ Invalid recipient! Use `gifter` to message your Secret Santa or `giftee` to message your recipient.")
+        partner = await self._resolve_user(partner_id)
+        if partner:
+            formatted_msg = route['notification'].format(message=message)
+            success = await self._send_dm_with_log(
+                partner, 
+                formatted_msg,
+                route['sender'].format(name=ctx.author.name), 
+                route['log_type']
+            )
+            if success:
+                await ctx.send(route['sent'])
+            else:
+                await ctx.send(route['dms_disabled'])
 
     @commands.command(name='setwishlist')
+    @requires_active_event()
     async def set_wishlist(self, ctx, *, wishlist):
         """Set your wishlist"""
         if len(wishlist) > 1000:
             await ctx.send("❌ Wishlist is too long! Please keep it under 1000 characters.\nTip: Consider using bullet points for better organization.")
             return
             
-        user_id = str(ctx.author.id)
+        user_id = ctx.author.id
         try:
-            self.db_manager.set_wishlist(user_id, wishlist)
+            # The update reports what's still missing, so no follow-up query is needed
+            user_missing = await self.db_manager.set_wishlist(user_id, wishlist)
+            if user_missing is None:
+                await ctx.send("❌ You haven't joined the Secret Santa yet! Use `s!join` to participate.")
+                return
             log_event("WISHLIST", f"{ctx.author.name} set their wishlist")
             await ctx.send("✅ Wishlist set successfully!")
             
             # Check if this completes their required info
-            missing_info = self.db_manager.check_missing_info()
-            user_missing = next((user for user in missing_info if user['user_id'] == user_id), None)
-            if user_missing:
-                if user_missing['missing_address']:
-                    await ctx.send("️ Don't forget to set your address using `s!setaddress`!")
+            if user_missing['missing_address']:
+                await ctx.send("️ Don't forget to set your address using `s!setaddress`!")
             else:
                 await ctx.send("🎄 Great! You've completed all required information!")
         except Exception as e:
             await ctx.send("❌ Error setting wishlist. Please try again with a shorter wishlist.")
-            print(f"Error setting wishlist: {e}")
+            log_event("WISHLIST", f"Error setting wishlist for {ctx.author.name}: {e}")
 
     @commands.command(name='setaddress')
+    @requires_active_event()
     async def set_address(self, ctx, *, address):
         """Set your address for gift delivery"""
         if len(address) > 1000:
             await ctx.send("❌ Address is too long! Please keep it under 1000 characters.\nTip: Only include essential delivery information.")
             return
             
-        user_id = str(ctx.author.id)
+        user_id = ctx.author.id
         try:
-            self.db_manager.set_address(user_id, address)
+            # The update reports what's still missing, so no follow-up query is needed
+            user_missing = await self.db_manager.set_address(user_id, address)
+            if user_missing is None:
+                await ctx.send("❌ You haven't joined the Secret Santa yet! Use `s!join` to participate.")
+                return
             log_event("ADDRESS", f"{ctx.author.name} set their address")
             await ctx.send("✅ Address set successfully! (Only your Secret Santa will see this)")
             
             # Check if this completes their required info
-            missing_info = self.db_manager.check_missing_info()
-            user_missing = next((user for user in missing_info if user['user_id'] == user_id), None)
-            if user_missing:
-                if user_missing['missing_wishlist']:
-                    await ctx.send("ℹ️ Don't forget to set your wishlist using `s!setwishlist`!")
+            if user_missing['missing_wishlist']:
+                await ctx.send("ℹ️ Don't forget to set your wishlist using `s!setwishlist`!")
             else:
                 await ctx.send("🎄 Great! You've completed all required information!")
         except Exception as e:
             await ctx.send("❌ Error setting address. Please try again with a shorter address.")
-            print(f"Error setting address: {e}")
+            log_event("ADDRESS", f"Error setting address for {ctx.author.name}: {e}")
 
     @commands.command(name='myinfo')
+    @requires_active_event()
+    @commands.cooldown(1, READ_COOLDOWN, commands.BucketType.user)
     async def view_my_info(self, ctx):
         """View your current Secret Santa information"""
-        user_id = str(ctx.author.id)
+        user_id = ctx.author.id
         
         # Get user's current info from database
-        self.db_manager._safe_execute("""
-            SELECT wishlist, address
-            FROM participants
-            WHERE user_id = %s
-        """, (user_id,))
-        result = self.db_manager.cursor.fetchone()
+        participant = await self.db_manager.get_participant(user_id)
         
-        if not result:
+        if not participant:
             await ctx.send("❌ You haven't joined the Secret Santa yet! Use `s!join` to participate.")
             return
             
-        wishlist, address = result
+        wishlist, address = participant['wishlist'], participant['address']
         
         # Create info message
         info_msg = (
@@ -382,94 +539,73 @@ class SecretSantaCog(commands.Cog):
             await ctx.send("❌ I couldn't send you a DM! Please check your privacy settings.")
 
     @commands.command(name='match')
+    @requires_active_event()
+    @commands.cooldown(1, READ_COOLDOWN, commands.BucketType.user)
     async def get_match_info(self, ctx):
         """Get your Secret Santa match information again"""
-        user_id = str(ctx.author.id)
+        user_id = ctx.author.id
         
-        # Get receiver information
-        receiver_id = self.db_manager.get_giftee_for_user(user_id)
-        if not receiver_id:
+        # Pairing and receiver details come back from a single join
+        receiver = await self.db_manager.get_partner_info(user_id)
+        if not receiver:
             await ctx.send("❌ You don't have a Secret Santa match yet! Wait for the event to start.")
             return
             
-        # Get receiver's details
-        self.db_manager._safe_execute("""
-            SELECT name, wishlist, address
-            FROM participants
-            WHERE user_id = %s
-        """, (receiver_id,))
-        result = self.db_manager.cursor.fetchone()
+        match_msg = MATCH_MSG.format_map(receiver)
         
-        if result:
-            name, wishlist, address = result
-            match_msg = (
-                f"🎄 Your Secret Santa match:\n\n"
-                f"**Recipient:** {name}\n"
-                f"**Wishlist:** {wishlist or 'No wishlist set'}\n"
-                f"**Delivery Address:** {address or 'No address set'}\n\n"
-                "You can message them anonymously using `s!message giftee <your message>`"
-            )
-            
-            # Send as DM
-            try:
-                await ctx.author.send(match_msg)
-                if isinstance(ctx.channel, discord.TextChannel):
-                    await ctx.send("📬 I've sent your match information in a DM!")
-            except discord.Forbidden:
-                await ctx.send("❌ I couldn't send you a DM! Please check your privacy settings.")
-        else:
-            await ctx.send("❌ Error retrieving match information. Please contact an administrator.")
+        # Send as DM
+        try:
+            await ctx.author.send(match_msg)
+            if isinstance(ctx.channel, discord.TextChannel):
+                await ctx.send("📬 I've sent your match information in a DM!")
+        except discord.Forbidden:
+            await ctx.send("❌ I couldn't send you a DM! Please check your privacy settings.")
 
     @commands.command(name='participants')
+    @requires_active_event()
+    @commands.cooldown(1, READ_COOLDOWN, commands.BucketType.user)
     async def list_participants(self, ctx):
         """List all participants in the Secret Santa event"""
-        if not self.db_manager.is_event_active():
-            await ctx.send("❌ There is no active Secret Santa event!")
-            return
-            
-        participants = self.db_manager.get_all_participants()
-        if not participants:
+        names = await self.db_manager.get_participant_names()
+        if not names:
             await ctx.send("No participants have joined yet!")
             return
             
-        participant_list = "🎄 **Current Participants:**\n"
-        for i, p in enumerate(participants, 1):
-            participant_list += f"{i}. {p['name']}\n"
+        # Paginate on line boundaries so no name is split across messages
+        paginator = commands.Paginator(prefix="🎄 **Current Participants:**", suffix=None, max_size=1900)
+        for i, name in enumerate(names, 1):
+            paginator.add_line(f"{i}. {name}")
             
-        # Split message if too long
-        if len(participant_list) > 1900:
-            chunks = [participant_list[i:i+1900] for i in range(0, len(participant_list), 1900)]
-            for i, chunk in enumerate(chunks, 1):
-                await ctx.send(f"Page {i}/{len(chunks)}:\n{chunk}")
+        pages = paginator.pages
+        if len(pages) > 1:
+            for i, page in enumerate(pages, 1):
+                await ctx.send(f"Page {i}/{len(pages)}:\n{page}")
         else:
-            await ctx.send(participant_list)
+            await ctx.send(pages[0])
+
+    @commands.command(name='info')
+    @commands.cooldown(1, READ_COOLDOWN, commands.BucketType.user)
+    async def view_bot_info(self, ctx):
+        """Display bot information"""
+        await ctx.send(self._get_info_message())
 
     @commands.command(name='logs')
+    @requires_event_manager("❌ Only the event creator or server administrators can use this command!")
     async def view_logs(self, ctx):
         """Display last 10 lines from the log file (Admin/Creator only)"""
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can use this command!")
-            return
-
         try:
-            with open('secret_santa.log', 'r') as log_file:
-                # Get last 10 lines
-                lines = log_file.readlines()
-                last_logs = lines[-10:] if len(lines) >= 10 else lines
+            with open(LOG_FILE, 'r') as log_file:
+                # Get last 10 lines, streaming the file instead of loading all of it
+                last_logs = deque(log_file, maxlen=10)
                 
-                log_text = "📋 **Last Log Entries:**\n\n"
-                log_text += ''.join(last_logs)
-                
-                # Send logs via DM
-                try:
-                    await ctx.author.send(log_text)
-                    await ctx.send("📬 Debug information has been sent to your DMs!")
-                except discord.Forbidden:
-                    await ctx.send("❌ Couldn't send DM. Please check your privacy settings.")
+            log_text = "📋 **Last Log Entries:**\n\n" + ''.join(last_logs)
+            
+            # Send logs via DM
+            try:
+                await ctx.author.send(log_text)
+                await ctx.send("📬 Debug information has been sent to your DMs!")
+            except discord.Forbidden:
+                await ctx.send("❌ Couldn't send DM. Please check your privacy settings.")
                     
         except FileNotFoundError:
             await ctx.send("❌ Log file not found!")
@@ -477,58 +613,31 @@ class SecretSantaCog(commands.Cog):
             await ctx.send(f"❌ Error reading logs: {str(e)}")
 
     @commands.command(name='remind')
+    @requires_active_event()
+    @requires_event_manager("❌ Only the event creator or server administrators can send reminders!")
+    @commands.cooldown(1, REMIND_COOLDOWN, commands.BucketType.guild)
     async def remind_missing_info(self, ctx):
         """Send reminders to participants with missing information"""
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can send reminders!")
-            return
-            
-        missing_info = self.db_manager.check_missing_info()
+        missing_info = await self.db_manager.check_missing_info()
         if not missing_info:
             await ctx.send("✅ All participants have completed their information!")
             return
             
-        reminder_sent = 0
-        for user in missing_info:
-            member = self.bot.get_user(int(user['user_id']))
-            if member:
-                missing_items = []
-                if user['missing_wishlist']:
-                    missing_items.append("wishlist (use s!setwishlist)")
-                if user['missing_address']:
-                    missing_items.append("address (use s!setaddress)")
-                
-                missing_msg = (
-                    "⚠️ The Secret Santa event cannot start because you haven't set your:\n"
-                    f"{', '.join(missing_items)}\n"
-                    "Please set these to allow the event to start!"
-                )
-                await member.send(missing_msg)
-                reminder_sent += 1
+        reminder_sent = await self._send_missing_info_reminders(missing_info)
         
         await ctx.send(f"📬 Sent reminders to {reminder_sent} participant(s) with missing information.")
         log_event("REMIND", f"Reminders sent by {ctx.author.name} to {reminder_sent} participants")
 
     @commands.command(name='broadcast')
+    @requires_active_event()
+    @requires_event_manager("❌ Only the event creator or server administrators can broadcast messages!")
     async def broadcast_message(self, ctx, *, message: str):
         """Send a message to all participants (Admin/Creator only)"""
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can broadcast messages!")
-            return
-            
         if len(message) > 1900:
             await ctx.send("❌ Message too long! Please keep it under 1900 characters.")
             return
             
-        participants = self.db_manager.get_all_participants()
+        participants = await self.db_manager.get_all_participants()
         if not participants:
             await ctx.send("❌ No participants to send messages to!")
             return
@@ -538,29 +647,29 @@ class SecretSantaCog(commands.Cog):
             f"{message}"
         )
         
-        success_count = 0
-        failed_count = 0
-        
-        for participant in participants:
-            member = self.bot.get_user(int(participant['user_id']))
-            if member:
-                try:
-                    await member.send(broadcast_msg)
-                    success_count += 1
-                    await self._log_message_sent(
-                        ctx.author.name,
-                        member.name,
-                        "BROADCAST",
-                        True
-                    )
-                except discord.Forbidden:
-                    failed_count += 1
-                    await self._log_message_sent(
-                        ctx.author.name,
-                        member.name,
-                        "BROADCAST",
-                        False
-                    )
+        sem = asyncio.Semaphore(DM_CONCURRENCY)
+
+        async def deliver(participant) -> bool:
+            # DM by ID with the name we already have, so no User lookup is needed
+            try:
+                async with sem:
+                    await self._wait_for_dm_slot()
+                    channel = await self._get_dm_channel(participant['user_id'])
+                    await channel.send(broadcast_msg)
+            except discord.Forbidden:
+                self._log_message_sent(ctx.author.name, participant['name'], "BROADCAST", False)
+                return False
+            except discord.HTTPException as e:
+                # Anything else would vanish into gather's results, so record who missed out and why
+                self._log_message_sent(ctx.author.name, participant['name'], "BROADCAST", False)
+                log_event("ERROR", f"Broadcast to {participant['name']} failed: {' '.join(str(e).split())}"[:300])
+                return False
+            self._log_message_sent(ctx.author.name, participant['name'], "BROADCAST", True)
+            return True
+
+        results = await asyncio.gather(*(deliver(p) for p in participants), return_exceptions=True)
+        success_count = sum(result is True for result in results)
+        failed_count = len(results) - success_count
         
         status_msg = (
             f"📬 Broadcast sent to {success_count} participant(s)\n"
@@ -570,20 +679,10 @@ class SecretSantaCog(commands.Cog):
         log_event("BROADCAST", f"Message broadcast by {ctx.author.name} to {success_count} participants")
 
     @commands.command(name='remove')
+    @requires_active_event()
+    @requires_event_manager("❌ Only the event creator or server administrators can remove participants!")
     async def remove_participant(self, ctx, *, user_identifier: str):
         """Remove a participant from the Secret Santa event (Admin/Creator only)"""
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can remove participants!")
-            return
-        
-        if not self.db_manager.is_event_active():
-            await ctx.send("❌ There is no active Secret Santa event!")
-            return
-        
         # Try to find user by mention, ID, or name
         target_user_id = None
         target_name = None
@@ -591,16 +690,16 @@ class SecretSantaCog(commands.Cog):
         # Check if it's a mention
         if ctx.message.mentions:
             target_user = ctx.message.mentions[0]
-            target_user_id = str(target_user.id)
+            target_user_id = target_user.id
             target_name = target_user.name
         # Check if it's a user ID
         elif user_identifier.isdigit():
-            target_user_id = user_identifier
-            user = self.bot.get_user(int(user_identifier))
+            target_user_id = int(user_identifier)
+            user = await self._resolve_user(target_user_id)
             target_name = user.name if user else f"User {user_identifier}"
         # Try to find by name
         else:
-            participant = self.db_manager.get_participant_by_name(user_identifier)
+            participant = await self.db_manager.get_participant_by_name(user_identifier)
             if participant:
                 target_user_id = participant['user_id']
                 target_name = participant['name']
@@ -609,12 +708,12 @@ class SecretSantaCog(commands.Cog):
                 return
         
         # Check if trying to remove the creator
-        if self.db_manager.is_creator_or_admin(target_user_id):
+        if target_user_id == await self._get_creator_id():
             await ctx.send("❌ Cannot remove the event creator! Use `s!cancel` to cancel the entire event instead.")
             return
         
         # Remove the participant
-        success = self.db_manager.remove_participant(target_user_id)
+        success = await self.db_manager.remove_participant(target_user_id)
         
         if success:
             log_event("REMOVE", f"{target_name} was removed from Secret Santa by {ctx.author.name}")
@@ -622,7 +721,7 @@ class SecretSantaCog(commands.Cog):
             
             # Try to notify the removed user
             try:
-                removed_user = self.bot.get_user(int(target_user_id))
+                removed_user = await self._resolve_user(target_user_id)
                 if removed_user:
                     await removed_user.send(
                         "ℹ️ You have been removed from the Secret Santa event by an administrator.\n"
@@ -634,6 +733,7 @@ class SecretSantaCog(commands.Cog):
             await ctx.send(f"❌ {target_name} is not a participant in the Secret Santa event.")
 
     @commands.command(name='ratelimit')
+    @requires_event_manager("❌ Only the event creator or server administrators can configure rate limiting!")
     async def set_rate_limit(self, ctx, action: str, value: int = None):
         """Configure rate limiting for bot commands (Admin/Creator only)
         
@@ -644,14 +744,6 @@ class SecretSantaCog(commands.Cog):
         s!ratelimit window 60 - Set window duration in seconds
         s!ratelimit status - Show current settings
         """
-        # Check if user is admin or creator
-        is_admin = isinstance(ctx.author, discord.Member) and ctx.author.guild_permissions.administrator
-        is_creator = self.db_manager.is_creator_or_admin(str(ctx.author.id))
-        
-        if not (is_admin or is_creator):
-            await ctx.send("❌ Only the event creator or server administrators can configure rate limiting!")
-            return
-        
         action = action.lower()
         
         if action == 'on':
@@ -669,6 +761,8 @@ class SecretSantaCog(commands.Cog):
                 await ctx.send("❌ Please provide a valid number of commands (minimum 1)")
                 return
             self.rate_limit_commands = value
+            # Existing histories are sized for the old limit
+            self.user_command_history.clear()
             await ctx.send(f"✅ Rate limit set to {value} commands per {self.rate_limit_window} seconds")
             log_event("RATELIMIT", f"Rate limit commands set to {value} by {ctx.author.name}")
             
@@ -690,56 +784,77 @@ class SecretSantaCog(commands.Cog):
                 f"Users can send {self.rate_limit_commands} commands every {self.rate_limit_window} seconds."
             )
         else:
-            await ctx.send(
-                "❌ Invalid action! Use:\n"
-                "`s!ratelimit on` - Enable rate limiting\n"
-                "`s!ratelimit off` - Disable rate limiting\n"
-                "`s!ratelimit commands <number>` - Set max commands\n"
-                "`s!ratelimit window <seconds>` - Set time window\n"
-                "`s!ratelimit status` - Show current settings"
-            )
+            await ctx.send(RATELIMIT_USAGE)
+
+    async def _send_missing_info_reminders(self, missing_info) -> int:
+        """DM everyone with missing information concurrently. Returns the number reminded"""
+        sem = asyncio.Semaphore(DM_CONCURRENCY)
+
+        async def remind(user):
+            missing_msg = MISSING_INFO_MSGS[(bool(user['missing_wishlist']), bool(user['missing_address']))]
+            async with sem:
+                await self._wait_for_dm_slot()
+                channel = await self._get_dm_channel(user['user_id'])
+                await channel.send(missing_msg)
+
+        sends = [remind(user) for user in missing_info]
+
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        for failure in failures:
+            log_event("REMIND", f"Reminder failed: {failure}")
+        return len(results) - len(failures)
+
+    async def _get_dm_channel(self, user_id: int) -> discord.DMChannel:
+        """Get a DM channel from just a user ID, reusing discord.py's cached channels"""
+        return await self.bot.create_dm(discord.Object(id=user_id))
+
+    async def _resolve_user(self, user_id: int):
+        """Get a user from the gateway cache, falling back to a cached API fetch"""
+        user = self.bot.get_user(user_id)
+        if user:
+            return user
+
+        user = self._fetched_users.get(user_id)
+        if user:
+            self._fetched_users.move_to_end(user_id)
+            return user
 
-    async def _send_match_notification(self, giver, receiver, wishlist, address):
+        try:
+            user = await self.bot.fetch_user(user_id)
+        except discord.HTTPException:
+            return None
+        self._fetched_users[user_id] = user
+        if len(self._fetched_users) > USER_CACHE_SIZE:
+            self._fetched_users.popitem(last=False)
+        return user
+
+    async def _send_match_notification(self, giver, receiver_name, wishlist, address):
         """Helper method to send match notification, handling long messages"""
-        intro_msg = (
-            f"🎄 Your Secret Santa match:\n\n"
-            f"**Recipient:** {receiver.name}\n"
-        )
-        await giver.send(intro_msg)
-
-        # Send wishlist (potentially split)
-        wishlist_msg = f"**Wishlist:**\n{wishlist or 'No wishlist set'}"
-        if len(wishlist_msg) > 1900:
-            chunks = [wishlist_msg[i:i+1900] for i in range(0, len(wishlist_msg), 1900)]
-            for i, chunk in enumerate(chunks, 1):
-                await giver.send(f"Wishlist (Part {i}/{len(chunks)}):\n{chunk}")
-        else:
-            await giver.send(wishlist_msg)
-
-        # Send address (potentially split)
-        address_msg = f"**Delivery Address:**\n{address or 'No address set'}"
-        if len(address_msg) > 1900:
-            chunks = [address_msg[i:i+1900] for i in range(0, len(address_msg), 1900)]
-            for i, chunk in enumerate(chunks, 1):
-                await giver.send(f"Address (Part {i}/{len(chunks)}):\n{chunk}")
-        else:
-            await giver.send(address_msg)
+        # Most matches fit in one message, so only split when it's too long
+        match_msg = MATCH_MSG.format_map({'name': receiver_name, 'wishlist': wishlist, 'address': address})
+        if len(match_msg) <= 1900:
+            await giver.send(match_msg)
+            return
 
-        # Send final instructions
-        await giver.send("You can message them anonymously using `s!message giftee <your message>`")
+        await giver.send(MATCH_INTRO_MSG.format_map({'name': receiver_name}))
 
-    async def _format_message_notification(self, message: str, is_from_gifter: bool) -> str:
-        """Format message notification with helpful reply instructions"""
-        prefix = "🎁 Your Secret Santa sent you a message:" if is_from_gifter else "🎄 Your giftee sent you a message:"
-        reply_cmd = "s!message gifter" if is_from_gifter else "s!message giftee"
-        
-        return (
-            f"{prefix}\n\n"
-            f"{message}\n\n"
-            f"To reply, use: `{reply_cmd} <your message>`"
-        )
+        # Send wishlist and address, each split into parts if needed
+        for part_label, section_msg in (
+            ("Wishlist", f"**Wishlist:**\n{wishlist}"),
+            ("Address", f"**Delivery Address:**\n{address}"),
+        ):
+            chunks = split_message(section_msg)
+            if len(chunks) == 1:
+                await giver.send(section_msg)
+            else:
+                for i, chunk in enumerate(chunks, 1):
+                    await giver.send(f"{part_label} (Part {i}/{len(chunks)}):\n{chunk}")
+
+        # Send final instructions
+        await giver.send(MATCH_INSTRUCTIONS)
 
-    async def _log_message_sent(self, sender: str, recipient: str, message_type: str, success: bool):
+    def _log_message_sent(self, sender: str, recipient: str, message_type: str, success: bool):
         """Log message sending attempts and results"""
         status = "✅" if success else "❌"
         log_event("MESSAGE", 
@@ -750,12 +865,12 @@ class SecretSantaCog(commands.Cog):
         """Send DM and log the attempt"""
         try:
             await user.send(message)
-            await self._log_message_sent(sender_name, user.name, message_type, True)
+            self._log_message_sent(sender_name, user.name, message_type, True)
             return True
         except discord.Forbidden:
-            await self._log_message_sent(sender_name, user.name, message_type, False)
+            self._log_message_sent(sender_name, user.name, message_type, False)
             return False
 
 async def setup(bot):
-    await bot.add_cog(SecretSantaCog(bot))
+    await bot.add_cog(SecretSantaCog(bot, bot.db_manager))
     print("SecretSanta cog loaded successfully!")
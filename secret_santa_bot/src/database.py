@@ -1,8 +1,88 @@
 import psycopg2
+from psycopg2 import errors, pool
+from psycopg2.extras import execute_values
 import os
-from typing import Dict, List, Optional
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 import random
 
+# Connection pool configuration (overridable via environment)
+DB_POOL_MIN = int(os.getenv('DB_POOL_MIN', '2'))
+DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', '20'))
+DB_CONNECT_TIMEOUT = int(os.getenv('DB_CONNECT_TIMEOUT', '10'))
+
+# Hot per-user statements, prepared once on each pooled connection
+PREPARED_STATEMENTS = {
+    'add_participant': """
+        PREPARE add_participant (bigint, text, boolean) AS
+        INSERT INTO participants (user_id, name, is_creator)
+        VALUES ($1, $2, $3)
+        ON CONFLICT (user_id)
+        DO UPDATE SET name = EXCLUDED.name, is_creator = participants.is_creator OR EXCLUDED.is_creator
+    """,
+    'set_wishlist': """
+        PREPARE set_wishlist (text, bigint) AS
+        UPDATE participants SET wishlist = $1
+        WHERE user_id = $2
+        RETURNING wishlist IS NULL, address IS NULL
+    """,
+    'set_address': """
+        PREPARE set_address (text, bigint) AS
+        UPDATE participants SET address = $1
+        WHERE user_id = $2
+        RETURNING wishlist IS NULL, address IS NULL
+    """,
+    'get_participant': """
+        PREPARE get_participant (bigint) AS
+        SELECT name, wishlist, address FROM participants WHERE user_id = $1
+    """,
+    'get_gifter_for_user': """
+        PREPARE get_gifter_for_user (bigint) AS
+        SELECT giver_id FROM pairings WHERE receiver_id = $1
+    """,
+    'get_giftee_for_user': """
+        PREPARE get_giftee_for_user (bigint) AS
+        SELECT receiver_id FROM pairings WHERE giver_id = $1
+    """,
+    'get_partner_info': """
+        PREPARE get_partner_info (bigint) AS
+        SELECT p.name, p.wishlist, p.address
+        FROM pairings
+        JOIN participants p ON p.user_id = pairings.receiver_id
+        WHERE giver_id = $1
+    """,
+}
+
+def assign_partners(participants: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Draw Secret Santa partners in memory; nothing is stored until DatabaseManager.save_pairings
+    Expects participants from get_start_snapshot, so receiver details need no query
+    Returns list of pairings with giver and receiver IDs and names, and receiver's info
+    """
+    if len(participants) < 2:
+        raise ValueError("Need at least 2 participants to create pairings")
+
+    # Shuffle everyone into one gift-giving circle where each person gives to the
+    # next; nobody can draw themselves, so a single O(N) pass always succeeds
+    circle = random.sample(participants, len(participants))
+    matches = zip(circle, circle[1:] + circle[:1])
+
+    return [{
+        'giver': giver['user_id'],
+        'giver_name': giver['name'],
+        'receiver': receiver['user_id'],
+        'receiver_name': receiver['name'],
+        'receiver_wishlist': receiver.get('wishlist') or "No wishlist set",
+        'receiver_address': receiver.get('address') or "No address set"
+    } for giver, receiver in matches]
+
+class _PreparingConnection(psycopg2.extensions.connection):
+    """Connection that remembers whether PREPARED_STATEMENTS exist in its session"""
+    prepared = False
+
 class DatabaseManager:
     def __init__(self):
         db_url = os.getenv('DATABASE_URL')
@@ -10,243 +90,301 @@ class DatabaseManager:
             raise ValueError("DATABASE_URL environment variable is not set")
 
         print(f"🔧 Connecting to database...")
-        self.conn = psycopg2.connect(db_url)
-        self.conn.autocommit = False  # Use explicit transactions
-        self.cursor = self.conn.cursor()
+        self._tables_ready = False
+        self._pool = pool.ThreadedConnectionPool(
+            minconn=DB_POOL_MIN,
+            maxconn=DB_POOL_MAX,
+            dsn=db_url,
+            connect_timeout=DB_CONNECT_TIMEOUT,
+            connection_factory=_PreparingConnection
+        )
         self.create_tables()
 
-    def _safe_execute(self, query, params=None):
-        """Execute a query with automatic rollback on error"""
-        try:
-            if params:
-                self.cursor.execute(query, params)
-            else:
-                self.cursor.execute(query)
-        except Exception as e:
-            self.conn.rollback()
-            raise e
-
-    def _safe_commit(self):
-        """Commit with rollback on error"""
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection, committing on success and rolling back on error"""
+        conn = self._pool.getconn()
         try:
-            self.conn.commit()
-        except Exception as e:
-            self.conn.rollback()
-            raise e
+            # Statements can only be prepared once the tables they reference exist
+            if self._tables_ready and not conn.prepared:
+                self._prepare_statements(conn)
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            # Drop connections the server has closed so the pool reconnects
+            self._pool.putconn(conn, close=bool(conn.closed))
+
+    def _prepare_statements(self, conn):
+        """Prepare the hot statements for the lifetime of this connection's session"""
+        with conn.cursor() as cur:
+            # PREPARE isn't rolled back, so clear any left by an earlier attempt that failed partway
+            cur.execute(";".join(("DEALLOCATE ALL", *PREPARED_STATEMENTS.values())))
+        conn.commit()
+        conn.prepared = True
 
     def create_tables(self):
         """Create database tables on startup"""
         print("📋 Creating database tables...")
 
-        self._safe_execute("""
-            CREATE TABLE IF NOT EXISTS participants (
-                id SERIAL PRIMARY KEY,
-                user_id TEXT UNIQUE,
-                name TEXT,
-                wishlist TEXT,
-                address TEXT,
-                is_creator BOOLEAN DEFAULT FALSE
-            )
-        """)
-
-        self._safe_execute("""
-            CREATE TABLE IF NOT EXISTS pairings (
-                id SERIAL PRIMARY KEY,
-                giver_id TEXT,
-                receiver_id TEXT,
-                FOREIGN KEY(giver_id) REFERENCES participants(user_id),
-                FOREIGN KEY(receiver_id) REFERENCES participants(user_id)
-            )
-        """)
-
-        self._safe_commit()
+        # Tables and indexes are created in one round-trip and one transaction
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS participants (
+                    id SERIAL PRIMARY KEY,
+                    user_id BIGINT UNIQUE,
+                    name TEXT,
+                    wishlist TEXT,
+                    address TEXT,
+                    is_creator BOOLEAN DEFAULT FALSE
+                );
+
+                CREATE TABLE IF NOT EXISTS pairings (
+                    id SERIAL PRIMARY KEY,
+                    giver_id BIGINT,
+                    receiver_id BIGINT,
+                    FOREIGN KEY(giver_id) REFERENCES participants(user_id),
+                    FOREIGN KEY(receiver_id) REFERENCES participants(user_id)
+                );
+
+                -- Tables created before IDs were stored as integers used TEXT columns
+                DO $$
+                BEGIN
+                    IF (SELECT data_type FROM information_schema.columns
+                        WHERE table_schema = current_schema()
+                            AND table_name = 'participants' AND column_name = 'user_id') = 'text' THEN
+                        ALTER TABLE pairings
+                            DROP CONSTRAINT IF EXISTS pairings_giver_id_fkey,
+                            DROP CONSTRAINT IF EXISTS pairings_receiver_id_fkey,
+                            ALTER COLUMN giver_id TYPE BIGINT USING giver_id::bigint,
+                            ALTER COLUMN receiver_id TYPE BIGINT USING receiver_id::bigint;
+                        ALTER TABLE participants ALTER COLUMN user_id TYPE BIGINT USING user_id::bigint;
+                        ALTER TABLE pairings
+                            ADD FOREIGN KEY(giver_id) REFERENCES participants(user_id),
+                            ADD FOREIGN KEY(receiver_id) REFERENCES participants(user_id);
+                    END IF;
+                END $$;
+
+                -- Each giver has exactly one giftee; receiver_id is included so partner
+                -- lookups by giver are index-only
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_pairings_giver_covering
+                    ON pairings(giver_id) INCLUDE (receiver_id);
+                CREATE INDEX IF NOT EXISTS idx_pairings_receiver ON pairings(receiver_id);
+            """)
+
+        self._tables_ready = True
         print("✅ Database tables ready!")
 
-    def add_participant(self, user_id: str, name: str, is_creator: bool = False):
+    def add_participant(self, user_id: int, name: str, is_creator: bool = False):
         """Add a participant to the Secret Santa event"""
-        self._safe_execute("""
-            INSERT INTO participants (user_id, name, is_creator)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (user_id)
-            DO UPDATE SET name = EXCLUDED.name, is_creator = EXCLUDED.is_creator
-        """, (user_id, name, is_creator))
-        self._safe_commit()
-
-    def set_wishlist(self, user_id: str, wishlist: str):
-        self._safe_execute("""
-            UPDATE participants SET wishlist = %s
-            WHERE user_id = %s
-        """, (wishlist, user_id))
-        self._safe_commit()
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE add_participant (%s, %s, %s)", (user_id, name, is_creator))
+
+    def set_wishlist(self, user_id: int, wishlist: str) -> Optional[Dict[str, bool]]:
+        """Set a participant's wishlist and return what info they're still missing.
+        Returns None if the user hasn't joined"""
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE set_wishlist (%s, %s)", (wishlist, user_id))
+            result = cur.fetchone()
+        return {'missing_wishlist': result[0], 'missing_address': result[1]} if result else None
 
     def get_pairings(self) -> List[Dict[str, str]]:
-        self._safe_execute("""
-            SELECT p1.name AS giver_name, p2.name AS receiver_name
-            FROM pairings
-            JOIN participants p1 ON pairings.giver_id = p1.user_id
-            JOIN participants p2 ON pairings.receiver_id = p2.user_id
-        """)
-        return [{"giver": row[0], "receiver": row[1]} for row in self.cursor.fetchall()]
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("""
+                SELECT p1.name AS giver_name, p2.name AS receiver_name
+                FROM pairings
+                JOIN participants p1 ON pairings.giver_id = p1.user_id
+                JOIN participants p2 ON pairings.receiver_id = p2.user_id
+            """)
+            return [{"giver": row[0], "receiver": row[1]} for row in cur.fetchall()]
 
     def get_all_participants(self) -> List[Dict[str, str]]:
-        self._safe_execute("""
-            SELECT user_id, name, wishlist
-            FROM participants
-        """)
-        rows = self.cursor.fetchall()
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("""
+                SELECT user_id, name, wishlist
+                FROM participants
+            """)
+            rows = cur.fetchall()
         return [{"user_id": row[0], "name": row[1], "wishlist": row[2]} for row in rows]
 
+    def get_start_snapshot(self) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+        """
+        Get all participants and those with missing info from a single query
+        Returns the same shapes as get_all_participants (plus address) and check_missing_info
+        """
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("""
+                SELECT user_id, name, wishlist, address
+                FROM participants
+            """)
+            rows = cur.fetchall()
+        participants = [
+            {"user_id": row[0], "name": row[1], "wishlist": row[2], "address": row[3]}
+            for row in rows
+        ]
+        missing_info = [{
+            'user_id': row[0],
+            'name': row[1],
+            'missing_wishlist': row[2] is None,
+            'missing_address': row[3] is None
+        } for row in rows if row[2] is None or row[3] is None]
+        return participants, missing_info
+
+    def get_participant_names(self) -> List[str]:
+        """Get just the names of all participants"""
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("SELECT name FROM participants")
+            return [row[0] for row in cur.fetchall()]
+
+    def get_participant(self, user_id: int) -> Optional[Dict[str, str]]:
+        """Get a participant's name, wishlist and address"""
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE get_participant (%s)", (user_id,))
+            result = cur.fetchone()
+        return {'name': result[0], 'wishlist': result[1], 'address': result[2]} if result else None
+
     def close_connection(self):
-        self.cursor.close()
-        self.conn.close()
+        self._pool.closeall()
 
-    def get_gifter_for_user(self, user_id: str) -> Optional[str]:
+    def get_gifter_for_user(self, user_id: int) -> Optional[int]:
         """Get the ID of the person giving a gift to this user"""
-        self._safe_execute("""
-            SELECT giver_id FROM pairings WHERE receiver_id = %s
-        """, (user_id,))
-        result = self.cursor.fetchone()
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE get_gifter_for_user (%s)", (user_id,))
+            result = cur.fetchone()
         return result[0] if result else None
 
-    def get_giftee_for_user(self, user_id: str) -> Optional[str]:
+    def get_giftee_for_user(self, user_id: int) -> Optional[int]:
         """Get the ID of the person this user is giving a gift to"""
-        self._safe_execute("""
-            SELECT receiver_id FROM pairings WHERE giver_id = %s
-        """, (user_id,))
-        result = self.cursor.fetchone()
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE get_giftee_for_user (%s)", (user_id,))
+            result = cur.fetchone()
         return result[0] if result else None
 
-    def get_partner_info(self, user_id: str) -> Optional[Dict[str, str]]:
-        """Get information about the user's gift recipient"""
-        self._safe_execute("""
-            SELECT p.name, p.wishlist
-            FROM pairings 
-            JOIN participants p ON p.user_id = pairings.receiver_id
-            WHERE giver_id = %s
-        """, (user_id,))
-        result = self.cursor.fetchone()
-        return {'name': result[0], 'wishlist': result[1] or "No wishlist set"} if result else None
-
-    def assign_partners(self, participants: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """
-        Assign Secret Santa partners and store in database
-        Returns list of pairings with giver, receiver, and receiver's info
-        """
-        if len(participants) < 2:
-            raise ValueError("Need at least 2 participants to create pairings")
-
-        # Clear existing pairings
-        self._safe_execute("DELETE FROM pairings")
-
-        # Create a copy of participants for receivers
-        receivers = participants.copy()
-        pairings = []
-
-        for giver in participants:
-            # Find valid receivers (excluding self)
-            valid_receivers = [r for r in receivers if r['user_id'] != giver['user_id']]
-
-            if not valid_receivers:
-                # If no valid receivers, rollback and try again
-                self.conn.rollback()
-                return self.assign_partners(participants)
-
-            # Randomly select a receiver
-            receiver = random.choice(valid_receivers)
-            receivers.remove(receiver)
-
-            # Get receiver's address
-            self._safe_execute("SELECT address FROM participants WHERE user_id = %s", (receiver['user_id'],))
-            address_result = self.cursor.fetchone()
-            receiver_address = address_result[0] if address_result else "No address set"
-
-            # Store pairing in database
-            self._safe_execute("""
-                INSERT INTO pairings (giver_id, receiver_id)
-                VALUES (%s, %s)
-            """, (giver['user_id'], receiver['user_id']))
-
-            # Add to pairings list
-            pairings.append({
-                'giver': giver['user_id'],
-                'receiver': receiver['user_id'],
-                'receiver_wishlist': receiver.get('wishlist', "No wishlist set"),
-                'receiver_address': receiver_address
-            })
-
-        self._safe_commit()
-        return pairings
+    def get_partner_info(self, user_id: int) -> Optional[Dict[str, str]]:
+        """Get the user's gift recipient and their details in one query.
+        Returns None if the user hasn't been matched"""
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE get_partner_info (%s)", (user_id,))
+            result = cur.fetchone()
+        return {
+            'name': result[0],
+            'wishlist': result[1] or "No wishlist set",
+            'address': result[2] or "No address set"
+        } if result else None
+
+    def save_pairings(self, pairings: List[Dict[str, str]]):
+        """Replace the stored pairings with approved ones from assign_partners"""
+        givers = [pairing['giver'] for pairing in pairings]
+        with self._conn() as conn, conn.cursor() as cur:
+            # Only rows for givers outside this draw are deleted; the rest are updated in place
+            cur.execute("DELETE FROM pairings WHERE giver_id <> ALL(%s)", (givers,))
+            execute_values(cur, """
+                INSERT INTO pairings (giver_id, receiver_id) VALUES %s
+                ON CONFLICT (giver_id) DO UPDATE SET receiver_id = EXCLUDED.receiver_id
+            """, [(pairing['giver'], pairing['receiver']) for pairing in pairings])
 
     def cancel_secret_santa(self):
         """Cancel the Secret Santa event by clearing all data"""
-        self._safe_execute("DELETE FROM pairings")
-        self._safe_execute("DELETE FROM participants")
-        self._safe_commit()
+        with self._conn() as conn, conn.cursor() as cur:
+            try:
+                # One statement that skips per-row deletes, but it needs table ownership
+                cur.execute("TRUNCATE pairings, participants RESTART IDENTITY")
+            except errors.InsufficientPrivilege:
+                conn.rollback()
+                cur.execute("DELETE FROM pairings; DELETE FROM participants")
 
     def is_event_active(self) -> bool:
         """Check if there's an active Secret Santa event"""
-        self._safe_execute("SELECT COUNT(*) FROM participants")
-        count = self.cursor.fetchone()[0]
-        return count > 0
-
-    def set_address(self, user_id: str, address: str):
-        self._safe_execute("""
-            UPDATE participants SET address = %s
-            WHERE user_id = %s
-        """, (address, user_id))
-        self._safe_commit()
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("SELECT EXISTS (SELECT 1 FROM participants)")
+            active = cur.fetchone()[0]
+        return active
+
+    def set_address(self, user_id: int, address: str) -> Optional[Dict[str, bool]]:
+        """Set a participant's address and return what info they're still missing.
+        Returns None if the user hasn't joined"""
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("EXECUTE set_address (%s, %s)", (address, user_id))
+            result = cur.fetchone()
+        return {'missing_wishlist': result[0], 'missing_address': result[1]} if result else None
 
     def check_missing_info(self) -> List[Dict[str, str]]:
         """Returns list of users with missing wishlist or address"""
-        self._safe_execute("""
-            SELECT user_id, name, wishlist, address
-            FROM participants
-            WHERE wishlist IS NULL OR address IS NULL
-        """)
-        rows = self.cursor.fetchall()
+        with self._conn() as conn, conn.cursor() as cur:
+            # Only the NULL flags are needed, so the text columns never leave the server
+            cur.execute("""
+                SELECT user_id, name, wishlist IS NULL, address IS NULL
+                FROM participants
+                WHERE wishlist IS NULL OR address IS NULL
+            """)
+            rows = cur.fetchall()
         return [{
             'user_id': row[0],
             'name': row[1],
-            'missing_wishlist': row[2] is None,
-            'missing_address': row[3] is None
+            'missing_wishlist': row[2],
+            'missing_address': row[3]
         } for row in rows]
 
-    def is_creator_or_admin(self, user_id: str) -> bool:
-        """Check if user is the creator of the current event"""
-        self._safe_execute("""
-            SELECT is_creator 
-            FROM participants 
-            WHERE user_id = %s
-        """, (user_id,))
-        result = self.cursor.fetchone()
-        return bool(result and result[0])
-
-    def remove_participant(self, user_id: str) -> bool:
+    def get_creator_id(self) -> Optional[int]:
+        """Get the user ID of the current event's creator, if there is one"""
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("SELECT user_id FROM participants WHERE is_creator LIMIT 1")
+            result = cur.fetchone()
+        return result[0] if result else None
+
+    def remove_participant(self, user_id: int) -> bool:
         """Remove a participant from the Secret Santa event"""
-        # First check if participant exists
-        self._safe_execute("""
-            SELECT user_id, is_creator FROM participants WHERE user_id = %s
-        """, (user_id,))
-        result = self.cursor.fetchone()
-        
-        if not result:
-            return False
-        
-        # Remove any pairings involving this user
-        self._safe_execute("DELETE FROM pairings WHERE giver_id = %s OR receiver_id = %s", (user_id, user_id))
-        
-        # Remove the participant
-        self._safe_execute("DELETE FROM participants WHERE user_id = %s", (user_id,))
-        self._safe_commit()
+        with self._conn() as conn, conn.cursor() as cur:
+            # First check if participant exists
+            cur.execute("""
+                SELECT user_id, is_creator FROM participants WHERE user_id = %s
+            """, (user_id,))
+            result = cur.fetchone()
+
+            if not result:
+                return False
+
+            # Remove any pairings involving this user
+            cur.execute("DELETE FROM pairings WHERE giver_id = %s OR receiver_id = %s", (user_id, user_id))
+
+            # Remove the participant
+            cur.execute("DELETE FROM participants WHERE user_id = %s", (user_id,))
         return True
 
     def get_participant_by_name(self, name: str) -> Optional[Dict[str, str]]:
         """Find a participant by their name (case-insensitive partial match)"""
-        self._safe_execute("""
-            SELECT user_id, name FROM participants 
-            WHERE LOWER(name) LIKE LOWER(%s)
-        """, (f"%{name}%",))
-        result = self.cursor.fetchone()
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute("""
+                SELECT user_id, name FROM participants
+                WHERE LOWER(name) LIKE LOWER(%s)
+            """, (f"%{name}%",))
+            result = cur.fetchone()
         if result:
             return {"user_id": result[0], "name": result[1]}
         return None
+
+
+class AsyncDatabaseManager:
+    """Awaitable wrapper that runs DatabaseManager calls off the event loop.
+
+    Calls are executed on a thread pool no larger than the connection pool,
+    so concurrent commands never wait on (or exhaust) pooled connections.
+    """
+
+    def __init__(self, db_manager: DatabaseManager):
+        self._db = db_manager
+        self._executor = ThreadPoolExecutor(max_workers=DB_POOL_MAX, thread_name_prefix='db')
+
+    def __getattr__(self, name):
+        attr = getattr(self._db, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(attr, *args, **kwargs))
+
+        return call
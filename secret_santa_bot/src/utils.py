@@ -1,13 +1,26 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-handler = RotatingFileHandler('secret_santa.log', maxBytes=1000000, backupCount=5)
+# Log file written here and read back by s!logs
+LOG_FILE = os.getenv('LOG_FILE', 'secret_santa.log')
+
+# The file is only created once something is logged
+handler = RotatingFileHandler(LOG_FILE, maxBytes=1000000, backupCount=5, delay=True)
 handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s:%(message)s'))
 
-logger.addHandler(handler)
+# Callers only enqueue records; a background thread does the file I/O
+log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+
+listener = QueueListener(log_queue, handler)
+listener.start()
+atexit.register(listener.stop)
 
 def log_event(event_type: str, description: str):
     logger.info(f"{event_type}: {description}")
@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# The bot runs from src/ and imports its modules top-level (e.g. `from database import ...`)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+# Keep the bot's log file out of the checkout when tests import utils
+os.environ['LOG_FILE'] = os.path.join(tempfile.mkdtemp(prefix='secret_santa_tests'), 'secret_santa.log')
@@ -0,0 +1,54 @@
+import pytest
+
+from database import assign_partners
+
+
+def make_participants(n):
+    return [
+        {'user_id': i, 'name': f"user{i}", 'wishlist': f"wish{i}", 'address': f"addr{i}"}
+        for i in range(1, n + 1)
+    ]
+
+
+@pytest.mark.parametrize('n', [2, 3, 5, 50])
+def test_assign_partners_is_a_single_cycle(n):
+    pairings = assign_partners(make_participants(n))
+    giftees = {pairing['giver']: pairing['receiver'] for pairing in pairings}
+
+    assert len(pairings) == n
+    assert sorted(giftees) == list(range(1, n + 1))
+    assert sorted(giftees.values()) == list(range(1, n + 1))
+    assert all(giver != receiver for giver, receiver in giftees.items())
+
+    # Following the chain from anyone visits everyone before returning
+    seen = [1]
+    while giftees[seen[-1]] != 1:
+        seen.append(giftees[seen[-1]])
+    assert sorted(seen) == list(range(1, n + 1))
+
+
+def test_assign_partners_two_people_swap():
+    pairings = assign_partners(make_participants(2))
+    assert {(pairing['giver'], pairing['receiver']) for pairing in pairings} == {(1, 2), (2, 1)}
+
+
+def test_assign_partners_copies_receiver_details():
+    for pairing in assign_partners(make_participants(4)):
+        receiver = pairing['receiver']
+        assert pairing['receiver_name'] == f"user{receiver}"
+        assert pairing['receiver_wishlist'] == f"wish{receiver}"
+        assert pairing['receiver_address'] == f"addr{receiver}"
+        assert pairing['giver_name'] == f"user{pairing['giver']}"
+
+
+def test_assign_partners_fills_placeholders_for_missing_info():
+    participants = make_participants(2)
+    participants[0].update(wishlist=None, address=None)
+    pairing = next(p for p in assign_partners(participants) if p['receiver'] == 1)
+    assert pairing['receiver_wishlist'] == "No wishlist set"
+    assert pairing['receiver_address'] == "No address set"
+
+
+def test_assign_partners_needs_two_participants():
+    with pytest.raises(ValueError):
+        assign_partners(make_participants(1))
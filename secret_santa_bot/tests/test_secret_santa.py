@@ -0,0 +1,87 @@
+from cogs import secret_santa
+from cogs.secret_santa import SecretSantaCog, split_message
+
+
+def test_split_message_short_text_is_one_chunk():
+    assert split_message("hello", size=10) == ["hello"]
+
+
+def test_split_message_text_at_limit_is_one_chunk():
+    text = "x" * 10
+    assert split_message(text, size=10) == [text]
+
+
+def test_split_message_chunk_boundaries():
+    text = "abcdefghijk"
+    assert split_message(text, size=5) == ["abcde", "fghij", "k"]
+
+
+def test_split_message_single_line_longer_than_limit():
+    line = "y" * 4000
+    chunks = split_message(line)
+    assert [len(chunk) for chunk in chunks] == [1900, 1900, 200]
+    assert "".join(chunks) == line
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def make_cog(monkeypatch, commands=3, window=30):
+    clock = FakeClock()
+    monkeypatch.setattr(secret_santa.time, 'time', clock.time)
+    cog = SecretSantaCog(bot=None, db_manager=None)
+    cog.rate_limit_commands = commands
+    cog.rate_limit_window = window
+    return cog, clock
+
+
+def test_rate_limit_blocks_after_limit_within_window(monkeypatch):
+    cog, clock = make_cog(monkeypatch)
+    for _ in range(3):
+        assert cog._check_rate_limit(1) == (False, 0)
+        clock.now += 1
+
+    limited, remaining = cog._check_rate_limit(1)
+    assert limited
+    # The oldest command (t=1000) leaves the window at t=1030
+    assert remaining == 27
+
+
+def test_rate_limit_evicts_expired_entries(monkeypatch):
+    cog, clock = make_cog(monkeypatch)
+    for _ in range(3):
+        cog._check_rate_limit(1)
+        clock.now += 1
+
+    # Past the first command's window only that entry is dropped
+    clock.now = 1000.0 + 30
+    assert cog._check_rate_limit(1) == (False, 0)
+    assert list(cog.user_command_history[1]) == [1001.0, 1002.0, 1030.0]
+    assert cog._check_rate_limit(1)[0]
+
+
+def test_rate_limit_is_per_user(monkeypatch):
+    cog, _ = make_cog(monkeypatch, commands=1)
+    assert cog._check_rate_limit(1) == (False, 0)
+    assert cog._check_rate_limit(1)[0]
+    assert cog._check_rate_limit(2) == (False, 0)
+
+
+def test_rate_limit_sweeps_idle_users(monkeypatch):
+    cog, clock = make_cog(monkeypatch)
+    cog._check_rate_limit(1)
+    clock.now += 31
+    cog._check_rate_limit(2)
+    assert list(cog.user_command_history) == [2]
+
+
+def test_rate_limit_disabled(monkeypatch):
+    cog, _ = make_cog(monkeypatch, commands=1)
+    cog.rate_limit_enabled = False
+    for _ in range(5):
+        assert cog._check_rate_limit(1) == (False, 0)